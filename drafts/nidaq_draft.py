@@ -1,37 +1,47 @@
-import nidaqmx
-from nidaqmx.constants import LineGrouping
+import os
 import time
+
 import numpy as np
-import csv
-import matplotlib.pyplot as plt
-import os
+
+SAMPLE_RATE_HZ = 1000.0
+READ_CHUNK_SIZE = 500
 
 
 # Function to write data to CSV
 def write_data_to_csv(filename, data, timestamps):
-    with open(filename, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(
-            ["Timestamp (s)", "Camera 1 Frame Clock", "Camera 2 Frame Clock"]
+    # one bulk write instead of one csv.writer row per sample
+    arr = np.column_stack([np.asarray(timestamps), np.asarray(data)])
+    with open(filename, mode="w", newline="", buffering=1 << 20) as file:
+        np.savetxt(
+            file,
+            arr,
+            delimiter=",",
+            fmt=["%.6f", "%d", "%d"],
+            header="Timestamp (s),Camera 1 Frame Clock,Camera 2 Frame Clock",
+            comments="",
         )
-        for i in range(len(data)):
-            writer.writerow([timestamps[i], data[i][0], data[i][1]])
 
 
 # Function to plot the first 3 seconds of the data
 def plot_frame_clocks(timestamps, data):
+    # matplotlib is only needed for plotting; keep its ~1 s import off the
+    # acquisition/CSV-only path
+    import matplotlib.pyplot as plt
+
     # Convert lists to numpy arrays for easier handling
-    timestamps = np.array(timestamps)
-    data = np.array(data)
+    timestamps = np.asarray(timestamps)
+    data = np.asarray(data)
 
-    # Only plot the first 3 seconds
+    # Only plot the first 3 seconds; timestamps are monotonic, so a binary
+    # search finds the cutoff and the slices are views
     max_time = 3
-    mask = timestamps <= max_time
+    cutoff = np.searchsorted(timestamps, max_time, side="right")
+    timestamps = timestamps[:cutoff]
+    data = data[:cutoff]
 
     # Plot Camera 1 and Camera 2 frame clocks
     plt.figure(figsize=(10, 6))
     plt.plot(
-        # timestamps[mask],
         timestamps,
         data[:, 0],
         label="Imaging Source (Cam 1)",
@@ -39,7 +49,6 @@ def plot_frame_clocks(timestamps, data):
         linewidth=1,
     )
     plt.plot(
-        # timestamps[mask],
         timestamps,
         data[:, 1],
         label="Inscopix (Cam 2)",
@@ -60,6 +69,9 @@ def plot_frame_clocks(timestamps, data):
 
 # Main function
 def main():
+    import nidaqmx
+    from nidaqmx.constants import AcquisitionType, LineGrouping
+
     # User input for acquisition time (seconds)
     animal_id = int(input("Enter the animal ID: "))
     session_id = int(input("Enter the session ID: "))
@@ -74,86 +86,73 @@ def main():
         "Dev1/port0/line4"  # Digital Input for Camera 2 Frame Clock, Inscopix
     )
 
-    # Initialize data storage
-    cam_data = []
-    timestamps = []
+    total_samples = int(acquisition_time * SAMPLE_RATE_HZ)
+    pre_trigger_samples = int(0.5 * SAMPLE_RATE_HZ)
 
-    # Create tasks for both Camera 1 and Camera 2 frame clocks
-    with nidaqmx.Task() as cam1_task, nidaqmx.Task() as cam2_task:
-        # Configure digital input channels for the frame clocks
-        cam1_task.di_channels.add_di_chan(
+    # Preallocated typed buffer instead of growing Python lists; TTL states
+    # fit in uint8 and chunks are written in place as they arrive
+    cam_buffer = np.empty((2, total_samples), dtype=np.uint8)
+
+    # One task samples both frame clocks against the device sample clock, so
+    # timing is deterministic and samples arrive in DMA-backed blocks instead
+    # of one software-timed read per sample
+    with nidaqmx.Task() as cam_task, nidaqmx.Task() as trigger_task:
+        cam_task.di_channels.add_di_chan(
             cam1_frame_clock_port, line_grouping=LineGrouping.CHAN_PER_LINE
         )
-        cam2_task.di_channels.add_di_chan(
+        cam_task.di_channels.add_di_chan(
             cam2_frame_clock_port, line_grouping=LineGrouping.CHAN_PER_LINE
         )
+        cam_task.timing.cfg_samp_clk_timing(
+            SAMPLE_RATE_HZ,
+            sample_mode=AcquisitionType.FINITE,
+            samps_per_chan=total_samples,
+        )
 
-        # Start the tasks for frame clock acquisition
-        cam1_task.start()
-        cam2_task.start()
+        # Hardware reference trigger: the device itself anchors the 500 ms
+        # pre-trigger window to the camera-trigger edge, so there is no
+        # software latency between trigger and acquisition split.
+        # Dev1/port0/line0 must be wired to PFI0 for this.
+        cam_task.triggers.reference_trigger.cfg_dig_edge_ref_trig(
+            "/Dev1/PFI0", pretrigger_samples=pre_trigger_samples
+        )
 
-        # Record the start time
-        start_time = time.time()
-        current_time = start_time
+        # Configure digital output channel for the camera trigger
+        trigger_task.do_channels.add_do_chan(
+            trigger_port, line_grouping=LineGrouping.CHAN_PER_LINE
+        )
 
-        # Start acquiring frame clock signals before triggering the cameras
+        cam_task.start()
         print("Starting frame clock acquisition...")
 
-        # Data acquisition loop for the 500ms before the trigger
-        while (current_time - start_time) < 0.5:
-            # Read the state of the frame clock signals (TTL)
-            cam1_signal = cam1_task.read()
-            cam2_signal = cam2_task.read()
-
-            # Get the timestamp
-            timestamp = current_time - start_time
-
-            # Store the data
-            cam_data.append([cam1_signal, cam2_signal])
-            timestamps.append(timestamp)
-
-            # Sleep for a short period to simulate sampling rate (e.g., 1 ms)
-            time.sleep(0.001)
-
-            # Update current time
-            current_time = time.time()
-
-        print("500 ms delay completed. Triggering cameras...")
-
-        # Create a task to trigger the cameras
-        with nidaqmx.Task() as trigger_task:
-            # Configure digital output channel
-            trigger_task.do_channels.add_do_chan(
-                trigger_port, line_grouping=LineGrouping.CHAN_PER_LINE
+        # The reference trigger is ignored until the pre-trigger window has
+        # filled; since the trigger line stays HIGH afterwards, an edge
+        # raised too early would never be re-seen and the finite
+        # acquisition would never complete. Wait until enough samples have
+        # been acquired before raising it.
+        while cam_task.in_stream.avail_samp_per_chan < pre_trigger_samples:
+            time.sleep(0.01)
+
+        # Set the trigger to HIGH and keep it HIGH throughout the acquisition;
+        # the same edge releases the cameras and the reference trigger
+        trigger_task.write(True)
+        print("Cameras triggered, acquiring...")
+
+        # Block-wise readout of the finite acquisition
+        acquired_samples = 0
+        while acquired_samples < total_samples:
+            chunk = min(READ_CHUNK_SIZE, total_samples - acquired_samples)
+            cam_buffer[:, acquired_samples : acquired_samples + chunk] = (
+                cam_task.read(number_of_samples_per_channel=chunk)
             )
+            acquired_samples += chunk
 
-            # Set the trigger to HIGH and keep it HIGH throughout the acquisition
-            trigger_task.write(True)  # Set the trigger to HIGH
-
-            # Continue data acquisition for the remaining time after the trigger
-            remaining_time = acquisition_time - 0.5
-            current_time = time.time()
-
-            while (current_time - start_time) < acquisition_time:
-                # Read the state of the frame clock signals (TTL)
-                cam1_signal = cam1_task.read()
-                cam2_signal = cam2_task.read()
-
-                # Get the timestamp
-                timestamp = current_time - start_time
-
-                # Store the data
-                cam_data.append([cam1_signal, cam2_signal])
-                timestamps.append(timestamp)
-
-                # Sleep for a short period to simulate sampling rate (e.g., 1 ms)
-                time.sleep(0.001)
-
-                # Update current time
-                current_time = time.time()
+        # Set the trigger to LOW after the entire acquisition time is completed
+        trigger_task.write(False)
 
-            # Set the trigger to LOW after the entire acquisition time is completed
-            trigger_task.write(False)  # Set the trigger to LOW
+    # (n_samples, 2) data and sample-clock timestamps
+    cam_data = cam_buffer.T
+    timestamps = np.arange(total_samples) / SAMPLE_RATE_HZ
 
     # Save the collected data for post-hoc analysis
     save_directory = r"C:\Users\Admin\arne"
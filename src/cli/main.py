@@ -3,18 +3,18 @@ import logging
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from xclock.devices import ClockDaqDevice, DummyDaqDevice, LabJackT4
 from xclock.errors import XClockException, XClockValueError
 
+if TYPE_CHECKING:
+    from xclock.devices import ClockDaqDevice
+
 logger = logging.getLogger(__name__)
 
-# Device mapping
-DEVICE_MAP = {
-    "labjackt4": LabJackT4,
-    "dummydaqdevice": DummyDaqDevice,
-}
+# Supported device names; the classes are imported lazily in create_device
+# so that e.g. `xclock --help` does not load the hardware driver libraries
+DEVICE_NAMES = ("labjackt4", "dummydaqdevice")
 
 
 def setup_logging(verbose: bool) -> None:
@@ -53,22 +53,25 @@ def parse_comma_separated_numbers(value: str) -> List[float]:
         raise argparse.ArgumentTypeError(f"Invalid number format: {e}")
 
 
-def create_device(device_name: str) -> ClockDaqDevice:
+def create_device(device_name: str) -> "ClockDaqDevice":
     """Create and initialize a DAQ device."""
-    if device_name not in DEVICE_MAP:
+    if device_name not in DEVICE_NAMES:
         raise XClockException(
-            f"Unsupported device: {device_name}. Supported: {list(DEVICE_MAP.keys())}"
+            f"Unsupported device: {device_name}. Supported: {list(DEVICE_NAMES)}"
         )
 
     try:
-        device_class = DEVICE_MAP[device_name]
+        if device_name == "labjackt4":
+            from xclock.devices import LabJackT4 as device_class
+        else:
+            from xclock.devices import DummyDaqDevice as device_class
         return device_class()
     except Exception as e:
         raise XClockException(f"Failed to initialize {device_name}: {e}")
 
 
 def setup_clocks(
-    device: ClockDaqDevice,
+    device: "ClockDaqDevice",
     clock_rates: List[float],
     number_of_pulses: Optional[List[int]] = None,
     duration_s: Optional[float] = None,
@@ -272,7 +275,7 @@ Examples:
 
     parser.add_argument(
         "--device",
-        choices=list(DEVICE_MAP.keys()),
+        choices=list(DEVICE_NAMES),
         default="labjackt4",
         required=False,
         help="DAQ device to use (default: labjackt4)",
@@ -1,64 +1,165 @@
+import concurrent.futures
+import functools
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
 import threading
+import time
 import tkinter as tk
+from collections import deque
 from pathlib import Path
 from tkinter import scrolledtext, ttk
 from typing import Optional
 
-from xclock.devices import ClockDaqDevice, DummyDaqDevice, LabJackT4
+from xclock.devices import ClockDaqDevice
 from xclock.errors import XClockException, XClockValueError
 
-# Device mapping
+
+def _load_labjack_t4():
+    from xclock.devices import LabJackT4
+
+    return LabJackT4
+
+
+def _load_dummy_daq_device():
+    from xclock.devices import DummyDaqDevice
+
+    return DummyDaqDevice
+
+
+# Device mapping; values are loaders so the GUI paints before the driver
+# bindings are imported — the classes resolve on the first probe
 DEVICE_MAP = {
-    "LabJack T4": LabJackT4,
-    "Dummy DAQ Device": DummyDaqDevice,
+    "LabJack T4": _load_labjack_t4,
+    "Dummy DAQ Device": _load_dummy_daq_device,
 }
 
-SETTINGS_FILE = Path.home() / "Documents" / "XClock" / "xclock_settings.json"
+# Computed once; every start reuses the same path object
+_OUTPUT_DIR = Path.home() / "Documents" / "XClock"
+
+SETTINGS_FILE = _OUTPUT_DIR / "xclock_settings.json"
+
+# One shared formatter instance for the console and GUI handlers
+_LOG_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+# The format above uses none of the thread/process fields, so skip the
+# per-record thread-ident/pid/multiprocessing lookups entirely
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Root-logger configuration happens once per process, not once per GUI
+_LOGGING_CONFIGURED = False
+
+# Splits comma-separated entry fields in one pass, swallowing whitespace
+_CSV_SPLIT = re.compile(r"[,\s]+")
+
+
+def _parse_csv(value: str, cast):
+    """Parse a comma-separated entry field into a list via ``cast``."""
+    return [cast(token) for token in _CSV_SPLIT.split(value.strip()) if token]
+
+
+def _block_text_input(event):
+    """Swallow keystrokes in the log widget while allowing copy shortcuts."""
+    if event.state & 0x4:  # Control held, e.g. Ctrl-C / Ctrl-A
+        return None
+    return "break"
 
 
 def check_device_availability(device_class):
-    """Check if a device is available by attempting to initialize it."""
+    """Check if a device is available without opening it where possible."""
     try:
-        device = device_class()
-        # Close/cleanup the device if it has a close method
-        if hasattr(device, "close"):
-            device.close()
-        return True
+        return device_class.is_available()
     except Exception:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _probe_devices() -> tuple:
+    """Probe each known device class once and cache the result.
+
+    Probing opens (and closes) real hardware, so the result is cached for
+    the lifetime of the process; call ``_probe_devices.cache_clear()`` to
+    force a re-probe (e.g. after plugging in a device).
+    """
+    classes = {name: loader() for name, loader in DEVICE_MAP.items()}
+
+    # Each probe is independent I/O, so they run concurrently and the wall
+    # time is the slowest probe instead of the sum of all probes.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(DEVICE_MAP)
+    ) as executor:
+        results = executor.map(check_device_availability, classes.values())
+        return tuple(
+            (name, device_class, is_available)
+            for (name, device_class), is_available in zip(classes.items(), results)
+        )
+
+
 def get_available_devices():
     """Get a dictionary of available devices."""
-    available = {}
-    for name, device_class in DEVICE_MAP.items():
-        if check_device_availability(device_class):
-            available[name] = device_class
-    return available
+    return {
+        name: device_class
+        for name, device_class, is_available in _probe_devices()
+        if is_available
+    }
 
 
 class TextHandler(logging.Handler):
-    """Custom logging handler that writes to a tkinter Text widget."""
+    """Custom logging handler that writes to a tkinter Text widget.
+
+    Records are buffered and flushed in batches so that a burst of log
+    messages causes one Tk insert/redraw instead of one per record.
+    """
+
+    # How long to coalesce records before flushing them to the widget
+    FLUSH_INTERVAL_MS = 50
+
+    # Oldest lines are dropped beyond this, so inserts and scrolling keep
+    # a bounded cost even after very long runs
+    MAX_LINES = 5000
 
     def __init__(self, text_widget):
         super().__init__()
         self.text_widget = text_widget
+        self._buffer: deque[str] = deque()
+        self._buffer_lock = threading.Lock()
+        self._flush_pending = False
 
     def emit(self, record):
         msg = self.format(record)
 
-        def append():
-            self.text_widget.configure(state="normal")
-            self.text_widget.insert(tk.END, msg + "\n")
-            self.text_widget.configure(state="disabled")
-            self.text_widget.see(tk.END)
-
-        # Schedule the update in the main thread
-        self.text_widget.after(0, append)
+        with self._buffer_lock:
+            self._buffer.append(msg + "\n")
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+
+        # Schedule a single batched update in the main thread
+        self.text_widget.after(self.FLUSH_INTERVAL_MS, self._flush)
+
+    def _flush(self):
+        with self._buffer_lock:
+            if not self._buffer:
+                self._flush_pending = False
+                return
+            joined = "".join(self._buffer)
+            self._buffer.clear()
+            self._flush_pending = False
+
+        # The widget stays writable (typing is blocked via a key binding),
+        # so no state toggles are needed around the insert
+        self.text_widget.insert(tk.END, joined)
+        # Trim once per flush, not per line
+        lines = int(self.text_widget.index("end-1c").split(".")[0])
+        if lines > self.MAX_LINES:
+            self.text_widget.delete("1.0", f"{lines - self.MAX_LINES}.0")
+        self.text_widget.see(tk.END)
 
 
 class XClockGUI:
@@ -69,42 +170,114 @@ class XClockGUI:
 
         self.device: Optional[ClockDaqDevice] = None
         self.is_running = False
-        self.clock_thread: Optional[threading.Thread] = None
+        self._done_event = threading.Event()
+
+        # One long-lived worker thread runs all clock tasks; starting
+        # clocks just enqueues a callable instead of spawning a thread
+        self._task_queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
         self.available_devices = {}
         self.text_handler: Optional[logging.Handler] = None
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+
+        self._saved_device: Optional[str] = None
 
         self.setup_logging()
-        self.check_devices()
+
+        # Cached once; the verbose toggle just sets levels on these
+        self._verbose_loggers = [
+            logging.getLogger(name)
+            for name in ("xclock", "xclock.devices", "xclock.devices.labjack_devices")
+        ]
+
         self.create_widgets()
         self.load_settings()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Let the window paint first; probing opens real hardware and runs
+        # in a background thread once the main loop is idle.
+        self.root.after_idle(self._start_device_probe)
+
     def check_devices(self):
         """Check which devices are available."""
         self.logger = logging.getLogger(__name__)
         self.logger.info("Checking device availability...")
 
-        for name, device_class in DEVICE_MAP.items():
-            is_available = check_device_availability(device_class)
+        # Both this method and get_available_devices read the same cached
+        # probe results, so hardware is opened at most once per probe cycle.
+        for name, device_class, is_available in _probe_devices():
             if is_available:
                 self.available_devices[name] = device_class
-                self.logger.info(f"✓ {name} is available")
+                self.logger.info("✓ %s is available", name)
             else:
-                self.logger.info(f"✗ {name} is not available")
+                self.logger.info("✗ %s is not available", name)
 
         if not self.available_devices:
             self.logger.warning("No devices are available!")
 
+    def _worker_loop(self):
+        """Dispatch queued tasks on the single long-lived worker thread."""
+        while True:
+            task = self._task_queue.get()
+            try:
+                task()
+            finally:
+                self._task_queue.task_done()
+
+    def _start_device_probe(self):
+        """Probe devices in the background and populate the device list."""
+        threading.Thread(target=self._probe_worker, daemon=True).start()
+
+    def _probe_worker(self):
+        self.check_devices()
+        self.root.after(0, self._update_device_widgets)
+
+    def _update_device_widgets(self):
+        """Apply probe results to the device selection widgets."""
+        available_device_names = list(self.available_devices.keys())
+        self.device_combo.config(
+            values=available_device_names,
+            state="readonly" if available_device_names else "disabled",
+        )
+
+        if self._saved_device in self.available_devices:
+            self.device_var.set(self._saved_device)
+        elif self.device_var.get() not in self.available_devices:
+            self.device_var.set(
+                available_device_names[0] if available_device_names else ""
+            )
+
+        unavailable_devices = [
+            name for name in DEVICE_MAP.keys() if name not in self.available_devices
+        ]
+        self.device_info_label.config(
+            text=f"Unavailable: {', '.join(unavailable_devices)}"
+            if unavailable_devices
+            else ""
+        )
+
+        if not self.is_running:
+            self.start_button.config(
+                state="normal" if self.available_devices else "disabled"
+            )
+
     def setup_logging(self):
         """Setup logging to GUI."""
+        global _LOGGING_CONFIGURED
         self.logger = logging.getLogger(__name__)
 
-        # Configure root logger
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            force=True,
-        )
+        # Configure the root logger only the first time a GUI is created;
+        # force=True would close and replace existing handlers on every
+        # re-instantiation
+        if not _LOGGING_CONFIGURED:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_LOG_FORMATTER)
+            logging.basicConfig(
+                level=logging.INFO,
+                handlers=[console_handler],
+            )
+            _LOGGING_CONFIGURED = True
 
         # Set xclock loggers
         logging.getLogger("xclock").setLevel(logging.INFO)
@@ -139,29 +312,21 @@ class XClockGUI:
             row=row, column=0, sticky=tk.W, pady=5
         )
 
-        # Only show available devices
-        available_device_names = list(self.available_devices.keys())
-        default_device = available_device_names[0] if available_device_names else ""
-
-        self.device_var = tk.StringVar(value=default_device)
-        device_combo = ttk.Combobox(
+        # Starts empty; _update_device_widgets fills it once probing is done
+        self.device_var = tk.StringVar(value="")
+        self.device_combo = ttk.Combobox(
             main_frame,
             textvariable=self.device_var,
-            values=available_device_names,
-            state="readonly" if available_device_names else "disabled",
+            values=[],
+            state="disabled",
             width=30,
         )
-        device_combo.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=5)
+        self.device_combo.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=5)
 
-        # Add info label if some devices are unavailable
-        unavailable_devices = [
-            name for name in DEVICE_MAP.keys() if name not in self.available_devices
-        ]
-        if unavailable_devices:
-            unavailable_text = f"Unavailable: {', '.join(unavailable_devices)}"
-            ttk.Label(
-                main_frame, text=unavailable_text, font=("", 8), foreground="gray"
-            ).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
+        self.device_info_label = ttk.Label(
+            main_frame, text="Probing devices…", font=("", 8), foreground="gray"
+        )
+        self.device_info_label.grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
 
         row += 1
 
@@ -277,7 +442,7 @@ class XClockGUI:
             text="Start Clocks",
             command=self.start_clocks,
             width=15,
-            state="normal" if self.available_devices else "disabled",
+            state="disabled",
         )
         self.start_button.pack(side=tk.LEFT, padx=5)
 
@@ -296,9 +461,10 @@ class XClockGUI:
         )
         row += 1
 
-        self.log_text = scrolledtext.ScrolledText(
-            main_frame, height=15, state="disabled", wrap=tk.WORD
-        )
+        # Left writable so log flushes need no state toggles; the key
+        # binding swallows user typing while copy shortcuts still work
+        self.log_text = scrolledtext.ScrolledText(main_frame, height=15, wrap=tk.WORD)
+        self.log_text.bind("<Key>", _block_text_input)
         self.log_text.grid(
             row=row,
             column=0,
@@ -309,24 +475,43 @@ class XClockGUI:
         main_frame.rowconfigure(row, weight=1)
         row += 1
 
-        # Clear log button
+        # Clear log / refresh devices buttons
         ttk.Button(main_frame, text="Clear Log", command=self.clear_log, width=15).grid(
             row=row, column=0, sticky=tk.W
         )
+        ttk.Button(
+            main_frame,
+            text="Refresh Devices",
+            command=self.refresh_devices,
+            width=15,
+        ).grid(row=row, column=1, sticky=tk.W)
 
-        # Add text handler to logger
+        # Add text handler to logger. Records are routed through a queue so
+        # worker threads only enqueue raw records; formatting and the Tk
+        # hand-off happen on the listener thread, off the device I/O path.
         self.text_handler = TextHandler(self.log_text)
-        self.text_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        self.text_handler.setFormatter(_LOG_FORMATTER)
+        self._log_queue: queue.Queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        # Drop any queue handler left behind by a previous GUI instance so
+        # records are not fed to a destroyed widget
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root_logger.removeHandler(handler)
+        root_logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue, self.text_handler, respect_handler_level=True
         )
-        logging.getLogger().addHandler(self.text_handler)
+        self._log_listener.start()
 
-        if not self.available_devices:
-            self.logger.warning(
-                "XClock GUI initialized - No devices available! Please connect a device and restart."
-            )
-        else:
-            self.logger.info("XClock GUI initialized")
+        self.logger.info("XClock GUI initialized")
+
+    def refresh_devices(self):
+        """Re-probe hardware and update the device selection."""
+        _probe_devices.cache_clear()
+        self.available_devices = {}
+        self.device_info_label.config(text="Probing devices…")
+        self._start_device_probe()
 
     def on_mode_change(self):
         """Handle mode change between continuous/duration/pulses."""
@@ -344,34 +529,28 @@ class XClockGUI:
 
     def on_verbose_change(self):
         """Handle verbose logging toggle."""
-        if self.verbose_var.get():
-            level = logging.DEBUG
-            logging.getLogger("xclock").setLevel(level)
-            logging.getLogger("xclock.devices").setLevel(level)
-            logging.getLogger("xclock.devices.labjack_devices").setLevel(level)
-            logging.getLogger().setLevel(level)
-            # Set level for all handlers on root logger
-            for handler in logging.getLogger().handlers:
-                handler.setLevel(level)
+        verbose = self.verbose_var.get()
+        if not verbose:
+            self.logger.debug("This DEBUG message should disappear after toggle")
+
+        level = logging.DEBUG if verbose else logging.INFO
+        root_logger = logging.getLogger()
+        for cached_logger in self._verbose_loggers:
+            cached_logger.setLevel(level)
+        root_logger.setLevel(level)
+        # Set level for all handlers on root logger
+        for handler in root_logger.handlers:
+            handler.setLevel(level)
+
+        if verbose:
             self.logger.debug("DEBUG level test message - you should see this!")
             self.logger.info("Verbose logging enabled (DEBUG level)")
         else:
-            self.logger.debug("This DEBUG message should disappear after toggle")
-            level = logging.INFO
-            logging.getLogger("xclock").setLevel(level)
-            logging.getLogger("xclock.devices").setLevel(level)
-            logging.getLogger("xclock.devices.labjack_devices").setLevel(level)
-            logging.getLogger().setLevel(level)
-            # Set level for all handlers on root logger
-            for handler in logging.getLogger().handlers:
-                handler.setLevel(level)
             self.logger.info("Verbose logging disabled (INFO level)")
 
     def clear_log(self):
         """Clear the log text widget."""
-        self.log_text.configure(state="normal")
         self.log_text.delete(1.0, tk.END)
-        self.log_text.configure(state="disabled")
 
     def parse_clock_rates(self):
         """Parse clock rates from input."""
@@ -379,7 +558,7 @@ class XClockGUI:
             rates_str = self.rates_var.get().strip()
             if not rates_str:
                 raise ValueError("Clock rates cannot be empty")
-            return [float(x.strip()) for x in rates_str.split(",") if x.strip()]
+            return _parse_csv(rates_str, float)
         except ValueError as e:
             raise XClockValueError(f"Invalid clock rates: {e}")
 
@@ -389,7 +568,7 @@ class XClockGUI:
             pulses_str = self.pulses_var.get().strip()
             if not pulses_str:
                 return None
-            return [int(x.strip()) for x in pulses_str.split(",") if x.strip()]
+            return _parse_csv(pulses_str, int)
         except ValueError as e:
             raise XClockValueError(f"Invalid number of pulses: {e}")
 
@@ -437,39 +616,45 @@ class XClockGUI:
                 f"Device supports only {len(available_channels)} channels."
             )
 
-        # Setup each clock channel
-        for i, rate in enumerate(clock_rates):
-            pulses = None
-
-            if number_of_pulses is not None:
-                pulses = number_of_pulses[i] if i < len(number_of_pulses) else None
-            elif duration_s is not None:
-                # Auto-calculate pulses from duration
-                pulses = int(duration_s * rate)
+        # Resolve the per-channel pulse counts once, outside the loop
+        if number_of_pulses is not None:
+            pulses_list = list(number_of_pulses) + [None] * (
+                len(clock_rates) - len(number_of_pulses)
+            )
+        elif duration_s is not None:
+            # Auto-calculate pulses from duration
+            pulses_list = [int(duration_s * rate) for rate in clock_rates]
+        else:
+            pulses_list = [None] * len(clock_rates)
 
+        # Setup each clock channel
+        for rate, channel_name, pulses in zip(
+            clock_rates, available_channels, pulses_list
+        ):
             channel = device.add_clock_channel(
                 clock_tick_rate_hz=rate,
-                channel_name=available_channels[i],
+                channel_name=channel_name,
                 number_of_pulses=pulses,
                 enable_clock_now=False,
             )
 
-            if pulses is not None:
-                pulse_info = f" ({pulses} pulses"
-                if duration_s is not None:
-                    pulse_info += f", ~{duration_s}s"
-                pulse_info += ")"
-            else:
-                pulse_info = " (continuous)"
-            self.logger.info(
-                f"Added clock: {rate} Hz on {channel.channel_name}{pulse_info}"
-            )
+            # Gate the per-channel message so its pieces are only built when
+            # INFO is actually enabled
+            if self.logger.isEnabledFor(logging.INFO):
+                if pulses is not None:
+                    pulse_info = f" ({pulses} pulses"
+                    if duration_s is not None:
+                        pulse_info += f", ~{duration_s}s"
+                    pulse_info += ")"
+                else:
+                    pulse_info = " (continuous)"
+                self.logger.info(
+                    "Added clock: %s Hz on %s%s", rate, channel.channel_name, pulse_info
+                )
 
     def run_clocks(self):
         """Run the clocks in a separate thread."""
         try:
-            import time
-
             clock_rates = self.parse_clock_rates()
             self.device = self.create_device()
             self.setup_clocks(self.device, clock_rates)
@@ -479,23 +664,23 @@ class XClockGUI:
             # Handle timestamp recording
             if self.record_timestamps_var.get():
                 self.logger.info("Recording edge timestamps...")
-                output_dir = Path.home() / "Documents" / "XClock"
-                output_dir.mkdir(parents=True, exist_ok=True)
+                _OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
                 # Use microseconds to ensure uniqueness even with rapid restarts
                 timestamp_str = time.strftime("%Y-%m-%d_%H-%M-%S")
                 microseconds = int((time.time() % 1) * 1000000)
-                filename = output_dir / f"xclock_timestamps_{timestamp_str}_{microseconds:06d}.csv"
+                filename = (
+                    _OUTPUT_DIR
+                    / f"xclock_timestamps_{timestamp_str}_{microseconds:06d}.csv"
+                )
 
                 # Parse extra channels
                 extra_channels = []
                 extra_str = self.extra_channels_var.get().strip()
                 if extra_str:
-                    extra_channels = [
-                        x.strip() for x in extra_str.split(",") if x.strip()
-                    ]
+                    extra_channels = _parse_csv(extra_str, str)
                     self.logger.info(
-                        f"Detecting edges on additional channels: {extra_channels}"
+                        "Detecting edges on additional channels: %s", extra_channels
                     )
 
                 self.device.start_clocks_and_record_edge_timestamps(
@@ -503,7 +688,7 @@ class XClockGUI:
                     filename=filename,
                     extra_channels=extra_channels,
                 )
-                self.logger.info(f"Timestamps saved to: {filename}")
+                self.logger.info("Timestamps saved to: %s", filename)
             else:
                 self.logger.info("Starting clocks...")
                 self.device.start_clocks(
@@ -512,8 +697,8 @@ class XClockGUI:
 
             if has_pulsed_clocks:
                 self.logger.info("All pulsed clocks finished.")
-                # Re-enable start button after pulsed clocks finish
-                self.root.after(0, self.on_clocks_finished)
+                # The main thread polls _done_event and resets the UI
+                self._done_event.set()
             else:
                 self.logger.info(
                     "Clocks running continuously. Click 'Stop Clocks' to stop."
@@ -521,10 +706,10 @@ class XClockGUI:
 
         except (XClockException, XClockValueError) as e:
             self.logger.error(f"Error: {e}")
-            self.root.after(0, self.on_clocks_finished)
+            self._done_event.set()
         except Exception as e:
             self.logger.error(f"Unexpected error: {e}")
-            self.root.after(0, self.on_clocks_finished)
+            self._done_event.set()
 
     def start_clocks(self):
         """Start clocks button handler."""
@@ -536,9 +721,20 @@ class XClockGUI:
         self.start_button.config(state="disabled")
         self.stop_button.config(state="normal")
 
-        # Run in separate thread to avoid blocking GUI
-        self.clock_thread = threading.Thread(target=self.run_clocks, daemon=True)
-        self.clock_thread.start()
+        # Runs on the persistent worker thread to avoid blocking the GUI;
+        # completion is polled from the main thread instead of marshalled
+        # via after(0)
+        self._done_event.clear()
+        self._task_queue.put(self.run_clocks)
+        self.root.after(100, self._check_done)
+
+    def _check_done(self):
+        """Poll the worker thread's completion flag from the main thread."""
+        if self._done_event.is_set():
+            self._done_event.clear()
+            self.on_clocks_finished()
+        elif self.is_running:
+            self.root.after(100, self._check_done)
 
     def stop_clocks(self):
         """Stop clocks button handler."""
@@ -579,8 +775,9 @@ class XClockGUI:
             with open(SETTINGS_FILE, "r") as f:
                 settings = json.load(f)
 
-            if "device" in settings and settings["device"] in self.available_devices:
-                self.device_var.set(settings["device"])
+            if "device" in settings:
+                # Applied once probing has finished and the device list exists
+                self._saved_device = settings["device"]
             if "rates" in settings:
                 self.rates_var.set(settings["rates"])
             if "mode" in settings:
@@ -628,6 +825,8 @@ class XClockGUI:
         self.save_settings()
         if self.is_running:
             self.stop_clocks()
+        if self._log_listener is not None:
+            self._log_listener.stop()
         self.root.destroy()
 
 
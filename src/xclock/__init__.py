@@ -1,2 +1,8 @@
-from .devices import LabJackT4
-import os.path
+def __getattr__(name):
+    # Re-export LabJackT4 lazily; an eager import here would defeat the
+    # lazy loading in xclock.devices
+    if name == "LabJackT4":
+        from .devices import LabJackT4
+
+        return LabJackT4
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,4 @@
 from xclock.devices.daq_device import ClockDaqDevice
-from xclock.devices.labjack_devices import LabJackT4
 from xclock.devices.dummy_daq_device import DummyDaqDevice
 
 __all__ = [
@@ -7,3 +6,13 @@ __all__ = [
     "LabJackT4",
     "DummyDaqDevice",
 ]
+
+
+def __getattr__(name):
+    # PEP 562: resolve LabJackT4 on first access so that importing the
+    # package does not pull in the LabJack LJM driver bindings
+    if name == "LabJackT4":
+        from xclock.devices.labjack_devices import LabJackT4
+
+        return LabJackT4
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,9 @@ class EdgeType(Enum):
     FALLING = "falling"
 
 
-@dataclass
+# slots avoids a per-instance __dict__; not frozen because devices flip
+# clock_enabled when clocks start and stop
+@dataclass(slots=True)
 class ClockChannel:
     channel_name: str
     clock_id: int
@@ -35,6 +37,21 @@ class ClockDaqDevice(ABC):
     def get_available_output_clock_channels() -> tuple[str, ...]:
         pass
 
+    @classmethod
+    def is_available(cls) -> bool:
+        """Whether a device of this type can currently be used.
+
+        The default probes by instantiating and closing a device; subclasses
+        should override this with a cheaper check where the driver offers
+        enumeration without opening.
+        """
+        try:
+            device = cls()
+            device.close()
+            return True
+        except Exception:
+            return False
+
     @abstractmethod
     def get_added_clock_channels(self) -> list[ClockChannel]:
         pass
@@ -92,3 +109,9 @@ class ClockDaqDevice(ABC):
     @abstractmethod
     def close(self):
         pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
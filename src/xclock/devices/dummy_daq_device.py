@@ -9,6 +9,10 @@ logger = logging.getLogger(__name__)
 
 
 class DummyDaqDevice(ClockDaqDevice):
+    # Constant channel tuples shared by every call of the getters below
+    available_input_trigger_channels = ("FOOIO4", "FOOIO5")
+    available_output_clock_channels = ("FOOCLK1", "FOOCLK2")
+
     def __init__(self):
         self.handle = 0  # Dummy handle
         self.base_clock_frequency_hz = 80000000  # 80 MHz dummy base frequency
@@ -16,13 +20,17 @@ class DummyDaqDevice(ClockDaqDevice):
         self._next_clock_id = 0
         self._clocks_running = False
 
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
     @staticmethod
     def get_available_input_start_trigger_channels() -> tuple[str, ...]:
-        return ("FOOIO4", "FOOIO5")
+        return DummyDaqDevice.available_input_trigger_channels
 
     @staticmethod
     def get_available_output_clock_channels() -> tuple[str, ...]:
-        return ("FOOCLK1", "FOOCLK2")
+        return DummyDaqDevice.available_output_clock_channels
 
     def get_added_clock_channels(self) -> list[ClockChannel]:
         """Return list of added clock channels."""
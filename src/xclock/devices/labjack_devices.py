@@ -1,10 +1,12 @@
 import copy
 import logging
 import os
+import queue
 import sys
 import threading
 import time
 from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import final, override
 
@@ -35,89 +37,88 @@ logger = logging.getLogger(__name__)
 SKIP_VALUE = -9999.0
 DEFAULT_OUTPUT_DIRECTORY = os.path.join(os.path.expanduser("~"), "Documents", "XClock")
 
-if not os.path.exists(DEFAULT_OUTPUT_DIRECTORY):
-    os.makedirs(DEFAULT_OUTPUT_DIRECTORY, exist_ok=True)
-
 
 class ExtendedFeatureIndices(IntEnum):
     PWM_OUT_FEATURE_INDEX = 0
     PWM_OUT_WITH_PHASE_EF_INDEX = 1
     PULSE_OUT_EF_INDEX = 2
+    INTERRUPT_COUNTER_EF_INDEX = 8
 
 
 class DigIoRegisters:
-    channel: str  # DIO#
-
-    def __init__(self, channel: str):
-        self.channel = channel
-
-    @property
-    def enable_extended_feature(self) -> str:
-        return f"{self.channel}_EF_ENABLE"
+    """Register names for a DIO channel's extended features.
 
-    @property
-    def feature_index(self) -> str:
-        return f"{self.channel}_EF_INDEX"
-
-    @property
-    def feature_configA(self) -> str:
-        return f"{self.channel}_EF_CONFIG_A"
+    All names are precomputed once per channel; obtain instances through
+    the cached _dig_io_registers() factory so the f-strings are not rebuilt
+    on every configure/start/stop call.
+    """
 
-    @property
-    def feature_configB(self) -> str:
-        return f"{self.channel}_EF_CONFIG_B"
+    __slots__ = (
+        "channel",
+        "enable_extended_feature",
+        "feature_index",
+        "feature_configA",
+        "feature_configB",
+        "feature_configC",
+        "clock_source",
+        "read_a",
+        "read_b",
+        "read_a_and_reset",
+    )
 
-    @property
-    def feature_configC(self) -> str:
-        return f"{self.channel}_EF_CONFIG_C"
+    channel: str  # DIO#
 
-    @property
-    def clock_source(self) -> str:
-        return f"{self.channel}_EF_CLOCK_SOURCE"
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.enable_extended_feature = f"{channel}_EF_ENABLE"
+        self.feature_index = f"{channel}_EF_INDEX"
+        self.feature_configA = f"{channel}_EF_CONFIG_A"
+        self.feature_configB = f"{channel}_EF_CONFIG_B"
+        self.feature_configC = f"{channel}_EF_CONFIG_C"
+        self.clock_source = f"{channel}_EF_CLOCK_SOURCE"
+        self.read_a = f"{channel}_EF_READ_A"
+        self.read_b = f"{channel}_EF_READ_B"
+        self.read_a_and_reset = f"{channel}_EF_READ_A_AND_RESET"
 
-    @property
-    def read_a(self) -> str:
-        return f"{self.channel}_EF_READ_A"
 
-    @property
-    def read_b(self) -> str:
-        return f"{self.channel}_EF_READ_B"
+class ClockRegisters:
+    """Register names for a DIO_EF clock; see DigIoRegisters on caching."""
 
+    __slots__ = ("clock_id", "enable", "roll_value", "divisor", "options", "count")
 
-class ClockRegisters:
     clock_id: int
 
     def __init__(self, clock_id: int):
         self.clock_id = clock_id
+        self.enable = f"DIO_EF_CLOCK{clock_id}_ENABLE"
+        self.roll_value = f"DIO_EF_CLOCK{clock_id}_ROLL_VALUE"
+        self.divisor = f"DIO_EF_CLOCK{clock_id}_DIVISOR"
+        self.options = f"DIO_EF_CLOCK{clock_id}_OPTIONS"
+        self.count = f"DIO_EF_CLOCK{clock_id}_COUNT"
 
-    @property
-    def enable(self):
-        return f"DIO_EF_CLOCK{self.clock_id}_ENABLE"
-
-    @property
-    def roll_value(self):
-        return f"DIO_EF_CLOCK{self.clock_id}_ROLL_VALUE"
 
-    @property
-    def divisor(self):
-        return f"DIO_EF_CLOCK{self.clock_id}_DIVISOR"
+# The devices only have a handful of DIO channels and clocks, so cache the
+# register-name helpers instead of re-instantiating them on every call.
+@lru_cache(maxsize=None)
+def _dig_io_registers(channel: str) -> DigIoRegisters:
+    return DigIoRegisters(channel)
 
-    @property
-    def options(self):
-        return f"DIO_EF_CLOCK{self.clock_id}_OPTIONS"
 
-    @property
-    def count(self):
-        return f"DIO_EF_CLOCK{self.clock_id}_COUNT"
+@lru_cache(maxsize=None)
+def _clock_registers(clock_id: int) -> ClockRegisters:
+    return ClockRegisters(clock_id)
 
 
-def _write_register_dict_to_ljm(handle, config: dict[str, int]):
-    ljm.eWriteNames(
-        handle=handle,
-        numFrames=len(config),
-        aNames=config.keys(),
-        aValues=config.values(),
-    )
+# Users pick from a handful of clock rates, so the timing parameters for a
+# given rate are computed once and replayed on repeated adds.
+@lru_cache(maxsize=64)
+def _clock_timing_params(
+    base_clock_frequency_hz: int, divisor: int, clock_tick_rate_hz: int
+) -> tuple[int, int]:
+    """Return (roll_value, actual_sample_rate_hz) for a requested rate."""
+    roll_value = base_clock_frequency_hz // divisor // clock_tick_rate_hz
+    actual_sample_rate_hz = base_clock_frequency_hz // divisor // roll_value
+    return roll_value, actual_sample_rate_hz
 
 
 def _reset_output_channels(handle: int, channel_names: list[str]):
@@ -129,16 +130,16 @@ def _reset_output_channels(handle: int, channel_names: list[str]):
     )
 
     for channel in channel_names:
-        ljm.eWriteName(handle, DigIoRegisters(channel).enable_extended_feature, 0)
+        ljm.eWriteName(handle, _dig_io_registers(channel).enable_extended_feature, 0)
 
-    logger.debug(f"Reset output channels {channel_names} to LOW, no EF")
+    logger.debug("Reset output channels %s to LOW, no EF", channel_names)
 
 
 def _enable_clocks(handle: int, clock_ids: list[int] = [0], enable: bool = True):
     ljm.eWriteNames(
         handle,
         len(clock_ids),
-        [ClockRegisters(id).enable for id in clock_ids],
+        [_clock_registers(id).enable for id in clock_ids],
         [int(enable)] * len(clock_ids),
     )
 
@@ -147,10 +148,28 @@ def _read_clock_counters(handle: int, clock_ids: list[int]) -> list[int]:
     return ljm.eReadNames(
         handle,
         numFrames=len(clock_ids),
-        aNames=[ClockRegisters(clock_id=id).count for id in clock_ids],
+        aNames=[_clock_registers(clock_id=id).count for id in clock_ids],
     )
 
 
+def _filter_against_register_cache(
+    config: dict[str, int], register_cache: dict[str, int] | None
+) -> dict[str, int]:
+    """Drop config frames whose value the device is already known to hold.
+
+    Only registers that are exclusively written by this module may be
+    filtered; registers the device changes on its own (EF reads, DIO state
+    during pulse output, enables) must bypass the cache.
+    """
+    if register_cache is None:
+        return config
+    return {
+        name: value
+        for name, value in config.items()
+        if register_cache.get(name) != value
+    }
+
+
 def _configure_channel_to_use_as_clock(
     handle: int,
     roll_value: int,  # = base_clock_frequency // divisor // sample_rate_hz
@@ -158,20 +177,13 @@ def _configure_channel_to_use_as_clock(
     clock_id: int,
     number_of_pulses: int | None = None,  # None = continuous
     enable_clock_now: bool = False,
+    register_cache: dict[str, int] | None = None,
 ):
-    registers = DigIoRegisters(channel_name)
+    registers = _dig_io_registers(channel_name)
+    clock_enable_register = _clock_registers(clock_id=clock_id).enable
 
     duty_cycle = round(0.5 * roll_value)
 
-    # disable, as we cannot change index if enabled
-    ljm.eWriteName(handle, registers.enable_extended_feature, 0)
-
-    # set channel to LOW to warrant proper signal generation
-    ljm.eWriteName(handle=handle, name=registers.channel, value=0)
-
-    # DIO_EF_CLOCK0_ENABLE = 0 // Disable the clock during config
-    _enable_clocks(handle=handle, clock_ids=[clock_id], enable=False)
-
     feature_index = (
         ExtendedFeatureIndices.PWM_OUT_FEATURE_INDEX
         if number_of_pulses is None
@@ -182,42 +194,65 @@ def _configure_channel_to_use_as_clock(
     if feature_index == ExtendedFeatureIndices.PULSE_OUT_EF_INDEX:
         feature_configC = number_of_pulses
 
-    config = {
-        registers.feature_index: feature_index,
-        registers.clock_source: clock_id,
-        registers.feature_configA: duty_cycle,
-        registers.feature_configB: 1,
-        registers.feature_configC: feature_configC,
-    }
+    config = _filter_against_register_cache(
+        {
+            registers.feature_index: int(feature_index),
+            registers.clock_source: clock_id,
+            registers.feature_configA: duty_cycle,
+            registers.feature_configB: 1,
+            registers.feature_configC: feature_configC,
+        },
+        register_cache,
+    )
 
-    _write_register_dict_to_ljm(handle, config)
+    # Single batched transaction instead of one USB round-trip per
+    # register. Frames are processed in order, so the extended feature and
+    # the clock are disabled and the channel is set LOW (for proper signal
+    # generation) before the feature registers are changed.
+    names = [
+        registers.enable_extended_feature,
+        registers.channel,
+        clock_enable_register,
+        *config.keys(),
+    ]
+    values = [0, 0, 0, *config.values()]
 
     if enable_clock_now:
-        config = {
-            registers.enable_extended_feature: 1,
-            ClockRegisters(clock_id=clock_id).enable: 1,
-        }
-        _write_register_dict_to_ljm(handle, config)
+        names += [registers.enable_extended_feature, clock_enable_register]
+        values += [1, 1]
+
+    ljm.eWriteNames(handle, len(names), names, values)
+    if register_cache is not None:
+        register_cache.update(config)
 
 
 def _configure_clock(
-    handle, clock_id: int, divisor: int, roll_value: int, enable: bool = False
+    handle,
+    clock_id: int,
+    divisor: int,
+    roll_value: int,
+    enable: bool = False,
+    register_cache: dict[str, int] | None = None,
 ):
-    register_names = ClockRegisters(clock_id)
+    register_names = _clock_registers(clock_id)
 
-    # disable the clock during config
-    ljm.eWriteName(handle, register_names.enable, 0)
+    config = _filter_against_register_cache(
+        {register_names.divisor: divisor, register_names.roll_value: roll_value},
+        register_cache,
+    )
 
-    # configure the clock
-    clock_config = {
-        register_names.divisor: divisor,
-        register_names.roll_value: roll_value,
-    }
+    # one batched transaction; the first frame disables the clock before
+    # divisor and roll value are changed
+    names = [register_names.enable, *config.keys()]
+    values = [0, *config.values()]
 
     if enable:
-        clock_config[register_names.enable] = int(enable)
+        names.append(register_names.enable)
+        values.append(int(enable))
 
-    _write_register_dict_to_ljm(handle, clock_config)
+    ljm.eWriteNames(handle, len(names), names, values)
+    if register_cache is not None:
+        register_cache.update(config)
 
 
 def _set_output_channels_state(handle: int, channel_names: list[str], state: int):
@@ -230,7 +265,7 @@ def _set_output_channels_state(handle: int, channel_names: list[str], state: int
         aNames=channel_names,
         aValues=[state] * len(channel_names),
     )
-    logger.debug(f"Set output channels {channel_names} to {state}")
+    logger.debug("Set output channels %s to %s", channel_names, state)
 
 
 @final
@@ -250,8 +285,10 @@ class LabJackT4(ClockDaqDevice):
 
     """
 
-    # clock signals can be given out on these channels
+    # clock signals can be given out on these channels; the frozenset is
+    # used for membership checks, the tuple keeps the public API ordering
     available_output_clock_channels = ("DIO6", "DIO7")
+    _available_output_clock_channel_set = frozenset(available_output_clock_channels)
 
     @staticmethod
     @override
@@ -276,17 +313,32 @@ class LabJackT4(ClockDaqDevice):
     def get_available_input_start_trigger_channels() -> tuple[str, ...]:
         return LabJackT4.available_input_trigger_channels
 
+    @classmethod
+    @override
+    def is_available(cls) -> bool:
+        """Check for a connected T4 via LJM enumeration, without opening it."""
+        if not LJM_AVAILABLE or ljm is None:
+            return False
+        try:
+            num_found = ljm.listAll(ljm.constants.dtT4, ljm.constants.ctANY)[0]
+        except ljm.LJMError:
+            return False
+        return num_found > 0
+
     base_clock_frequency_hz = 80_000_000  # 80 MHz
     divisor = 256
 
+    # LJM interval handle used by wait_for_trigger_edge (the streamer uses 0)
+    _TRIGGER_INTERVAL_HANDLE = 1
+
     handle: int | None = None
     deviceType: int
     connectionType: int
     serialNumber: int
 
     _used_clock_channel_names: set[str]
-    _unused_clock_channel_names: set[str]
-    _clock_copy_channel_names: list[str] = ["EIO6", "EIO7"]
+    _unused_clock_channel_names: list[str]
+    _clock_copy_channel_names: tuple[str, ...] = ("EIO6", "EIO7")
     _clock_channels: list[ClockChannel]
     _clock_on_indicator_channel: str  # channel that is ON during clock output
     _all_digital_channels = [f"DIO{channel}" for channel in range(4, 20)]
@@ -294,6 +346,9 @@ class LabJackT4(ClockDaqDevice):
     def __init__(self):
         self._used_clock_channel_names = set()
         self._clock_channels = []
+        # shadow copy of configuration registers we have written; used to
+        # skip redundant device round-trips on reconfiguration
+        self._register_write_cache: dict[str, int] = {}
 
         if not LJM_AVAILABLE or ljm is None:
             self.handle = None
@@ -314,7 +369,12 @@ class LabJackT4(ClockDaqDevice):
         (self.deviceType, self.connectionType, self.serialNumber, _, _, _) = (
             ljm.getHandleInfo(self.handle)
         )
-        assert self.deviceType == ljm.constants.dtT4, "Device is not a LabJack T4"
+        # A real error rather than an assert: asserts vanish under -O and
+        # would leave a half-constructed object holding an open handle
+        if self.deviceType != ljm.constants.dtT4:
+            ljm.close(self.handle)
+            self.handle = None
+            raise XClockException("Opened device is not a LabJack T4")
 
         connectionTypeString = (
             "USB" if self.connectionType == ljm.constants.ctUSB else "Ethernet"
@@ -325,6 +385,18 @@ class LabJackT4(ClockDaqDevice):
 
         self._clock_on_indicator_channel = LabJackT4.avilable_output_const_channels[0]
 
+        # Precomputed enable batch used by start_clocks; extended whenever a
+        # clock channel is added so the trigger->start critical path only
+        # has to issue the prepared transaction.
+        # Lazily resolved (addresses, types, values) form of the batch
+        # above; invalidated whenever the configuration changes
+        self._start_register_frames: (
+            tuple[list[int], list[int], list[float]] | None
+        ) = None
+        self._start_register_config: dict[str, int] = {
+            self._clock_on_indicator_channel: 1
+        }
+
         # disable pullup on all channels (TODO: This does not seem to work on LabJack T4
         # although it is supposed to)
         # ljm.eWriteName(self.handle, "DIO_PULLUP_DISABLE", 0b111111111110000)
@@ -345,19 +417,40 @@ class LabJackT4(ClockDaqDevice):
         # disable clock0 as its mutually exclusive with CLOCK1 and CLOCK2
         _enable_clocks(self.handle, [0], False)
 
-        self._unused_clock_channel_names = set(
+        # kept in declaration order so auto-allocation is deterministic
+        # (DIO6 first, then DIO7)
+        self._unused_clock_channel_names = list(
             LabJackT4.available_output_clock_channels
         )
 
     def close(self):
-        """Close the connection to the LabJack device."""
-        if self.handle is not None:
-            try:
-                ljm.close(self.handle)
-            except Exception as e:
-                logger.error(f"Failed to close LabJack T4: {e}")
-            finally:
-                self.handle = None
+        """Close the connection to the LabJack device.
+
+        Sets all configured output channels LOW first so no clock or
+        indicator line is left HIGH after the handle is released.
+        """
+        if self.handle is None or ljm is None:
+            return
+        try:
+            channels_to_disable = [ch.channel_name for ch in self._clock_channels]
+            channels_to_disable.append(self._clock_on_indicator_channel)
+            ljm.eWriteNames(
+                handle=self.handle,
+                numFrames=len(channels_to_disable),
+                aNames=channels_to_disable,
+                aValues=[0] * len(channels_to_disable),
+            )
+        except Exception as e:
+            # Handle is already closed or invalid - this is OK during cleanup
+            error_code = getattr(e, "errorCode", None)
+            if error_code != 1224:  # LJME_DEVICE_NOT_OPEN
+                logger.debug("Error during device cleanup: %s", e)
+        try:
+            ljm.close(self.handle)
+        except Exception as e:
+            logger.error(f"Failed to close LabJack T4: {e}")
+        finally:
+            self.handle = None
 
     @override
     def start_clocks(
@@ -376,9 +469,12 @@ class LabJackT4(ClockDaqDevice):
 
         """
 
-        logger.debug(
-            f"Starting clocks on {[channel.channel_name for channel in self._clock_channels]} indicator on {self._clock_on_indicator_channel}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Starting clocks on %s indicator on %s",
+                [channel.channel_name for channel in self._clock_channels],
+                self._clock_on_indicator_channel,
+            )
         if self.handle is None:
             raise XClockException("Labjack device is not initialized")
 
@@ -387,14 +483,22 @@ class LabJackT4(ClockDaqDevice):
                 "No clock channels configured. Use add_clock_channel() first"
             )
 
-        config = {DigIoRegisters(self._clock_on_indicator_channel).channel: 1}
+        # Resolve the prepared batch to integer Modbus addresses once per
+        # configuration; eWriteAddresses then skips the per-name lookup on
+        # every subsequent start
+        if self._start_register_frames is None:
+            names = list(self._start_register_config.keys())
+            addresses, types = ljm.namesToAddresses(len(names), names)
+            self._start_register_frames = (
+                addresses,
+                types,
+                [float(value) for value in self._start_register_config.values()],
+            )
+        addresses, types, values = self._start_register_frames
+        ljm.eWriteAddresses(self.handle, len(addresses), addresses, types, values)
         for channel in self._clock_channels:
-            config[DigIoRegisters(channel.channel_name).enable_extended_feature] = 1
-            config[ClockRegisters(channel.clock_id).enable] = 1
             channel.clock_enabled = True
 
-        _write_register_dict_to_ljm(handle=self.handle, config=config)
-
         if wait_for_pulsed_clocks_to_finish:
             pulsed_clocks = [
                 channel
@@ -404,30 +508,35 @@ class LabJackT4(ClockDaqDevice):
             if len(pulsed_clocks) == 0:
                 return
 
-            logger.debug(f"Waiting for pulsed clocks to finish: {pulsed_clocks}")
+            logger.debug("Waiting for pulsed clocks to finish: %s", pulsed_clocks)
             register_names = [
                 (
-                    DigIoRegisters(clock.channel_name).read_a,
-                    DigIoRegisters(clock.channel_name).read_b,
+                    _dig_io_registers(clock.channel_name).read_a,
+                    _dig_io_registers(clock.channel_name).read_b,
                 )
                 for clock in pulsed_clocks
             ]
             isDone = [False] * len(register_names)
+            # one read covering every pulsed clock per poll cycle instead of
+            # one device round-trip per clock
+            flat_names = [name for pair in register_names for name in pair]
             # t_start = time.time()
             try:
                 while not all(isDone):
-                    for index, channel_register in enumerate(register_names):
-                        completed, target = ljm.eReadNames(
-                            self.handle,
-                            len(channel_register),
-                            aNames=channel_register,
+                    results = ljm.eReadNames(
+                        self.handle, len(flat_names), aNames=flat_names
+                    )
+                    for index in range(len(register_names)):
+                        completed, target = (
+                            results[2 * index],
+                            results[2 * index + 1],
                         )
                         if completed >= target:
                             isDone[index] = True
                 # delay to let incoming edges settle/be processed
                 time.sleep(delay_after_last_pulse_s)
                 ljm.eWriteName(
-                    self.handle, DigIoRegisters(self._clock_on_indicator_channel).channel, 0
+                    self.handle, _dig_io_registers(self._clock_on_indicator_channel).channel, 0
                 )
                 for clock in pulsed_clocks:
                     clock.clock_enabled = False
@@ -445,11 +554,11 @@ class LabJackT4(ClockDaqDevice):
 
         registers = (
             [
-                ClockRegisters(channel.clock_id).enable
+                _clock_registers(channel.clock_id).enable
                 for channel in self._clock_channels
             ]
             + [
-                DigIoRegisters(channel.channel_name).enable_extended_feature
+                _dig_io_registers(channel.channel_name).enable_extended_feature
                 for channel in self._clock_channels
             ]
             + [channel.channel_name for channel in self._clock_channels]
@@ -503,11 +612,11 @@ class LabJackT4(ClockDaqDevice):
             )
 
         if channel_name is None:
-            channel_name = self._unused_clock_channel_names.pop()
+            channel_name = self._unused_clock_channel_names.pop(0)
+        elif channel_name in self._unused_clock_channel_names:
+            self._unused_clock_channel_names.remove(channel_name)
 
-        self._unused_clock_channel_names.discard(channel_name)
-
-        if channel_name not in self.get_available_output_clock_channels():
+        if channel_name not in self._available_output_clock_channel_set:
             raise XClockValueError(
                 f"Invalid clock channel name {channel_name}. Must be in {self.get_available_output_clock_channels()}"
             )
@@ -515,19 +624,17 @@ class LabJackT4(ClockDaqDevice):
         clock_id = (
             len(self._used_clock_channel_names) + 1
         )  # CLOCK1 and CLOCK2 are used for PWM
-        roll_value = (
-            int(LabJackT4.base_clock_frequency_hz)
-            // self.divisor
-            // int(clock_tick_rate_hz)
+        roll_value, actual_sample_rate = _clock_timing_params(
+            int(LabJackT4.base_clock_frequency_hz),
+            self.divisor,
+            int(clock_tick_rate_hz),
         )
         _configure_clock(
             handle=self.handle,
             clock_id=clock_id,
             divisor=self.divisor,
             roll_value=roll_value,
-        )
-        actual_sample_rate = (
-            int(self.base_clock_frequency_hz) // self.divisor // roll_value
+            register_cache=self._register_write_cache,
         )
 
         _configure_channel_to_use_as_clock(
@@ -537,6 +644,7 @@ class LabJackT4(ClockDaqDevice):
             clock_id=clock_id,
             enable_clock_now=enable_clock_now,
             number_of_pulses=number_of_pulses,
+            register_cache=self._register_write_cache,
         )
 
         self._used_clock_channel_names.add(channel_name)
@@ -553,6 +661,13 @@ class LabJackT4(ClockDaqDevice):
                 number_of_pulses=number_of_pulses,
             )
         )
+
+        self._start_register_config[
+            _dig_io_registers(channel_name).enable_extended_feature
+        ] = 1
+        self._start_register_config[_clock_registers(clock_id).enable] = 1
+        self._start_register_frames = None
+
         return self._clock_channels[-1]
 
     def remove_clock_channel(self, channel_name: str) -> None:
@@ -602,24 +717,15 @@ class LabJackT4(ClockDaqDevice):
         return out
 
     def __del__(self):
-        if self.handle and ljm is not None:
-            try:
-                channels_to_disable = []
-                channels_to_disable.extend([ch.channel_name for ch in self._clock_channels])
-                channels_to_disable.extend([self._clock_on_indicator_channel])
-                ljm.eWriteNames(
-                    handle=self.handle,
-                    numFrames=len(channels_to_disable),
-                    aNames=channels_to_disable,
-                    aValues=[0] * len(channels_to_disable),
-                )
-                ljm.close(self.handle)
-            except Exception as e:
-                # Handle is already closed or invalid - this is OK during cleanup
-                # Check if it's the specific "device not open" error
-                error_code = getattr(e, 'errorCode', None)
-                if error_code != 1224:  # LJME_DEVICE_NOT_OPEN
-                    logger.debug(f"Error during device cleanup: {e}")
+        # Safety net only; close() is the deterministic path (also via the
+        # context manager). Guarded because finalizers can run during
+        # interpreter shutdown when module globals are already torn down.
+        if getattr(self, "handle", None) is None:
+            return
+        try:
+            self.close()
+        except Exception:
+            pass
 
     @override
     def wait_for_trigger_edge(
@@ -631,25 +737,45 @@ class LabJackT4(ClockDaqDevice):
         """
         Waits for a rising edge (0->1) on the specified digital input channel.
         Returns True if a rising edge is detected within the timeout, else False.
-        Uses LJM_WaitForNextInterval for precise polling.
+
+        Edges are counted in hardware via the DIO extended feature
+        "Interrupt Counter", so pulses shorter than the polling interval are
+        not missed and the host only polls the count register at 5 ms
+        intervals instead of sampling the line itself.
         """
 
-        interval_us = 1000  # 1 ms
-        register = channel_name
-        start_time = time.time()
-        prev_value = ljm.eReadName(self.handle, register)
-        interval_handle = 1  # Use 1 as the interval handle ID
+        registers = _dig_io_registers(channel_name)
+
+        # arm the hardware edge counter (counts rising edges)
+        ljm.eWriteNames(
+            self.handle,
+            3,
+            [
+                registers.enable_extended_feature,
+                registers.feature_index,
+                registers.enable_extended_feature,
+            ],
+            [0, int(ExtendedFeatureIndices.INTERRUPT_COUNTER_EF_INDEX), 1],
+        )
+
+        interval_us = 5000  # 5 ms
+        # monotonic() is immune to wall-clock adjustments and cheaper than
+        # time() on most platforms
+        start_time = time.monotonic()
+        interval_handle = self._TRIGGER_INTERVAL_HANDLE
         ljm.startInterval(interval_handle, interval_us)
         try:
-            while time.time() - start_time < timeout_s:
-                value = ljm.eReadName(self.handle, register)
-                if prev_value == 0 and value == 1:
-                    logger.debug(f"Rising edge detected on {channel_name}")
+            # discard edges counted before this call
+            _ = ljm.eReadName(self.handle, registers.read_a_and_reset)
+            while time.monotonic() - start_time < timeout_s:
+                count = ljm.eReadName(self.handle, registers.read_a_and_reset)
+                if count > 0:
+                    logger.debug("Rising edge detected on %s", channel_name)
                     return True
-                prev_value = value
                 ljm.waitForNextInterval(interval_handle)
         finally:
             ljm.cleanInterval(interval_handle)
+            ljm.eWriteName(self.handle, registers.enable_extended_feature, 0)
         logger.warning(f"Timeout waiting for rising edge on {channel_name}")
         return False
 
@@ -661,9 +787,11 @@ class LabJackT4(ClockDaqDevice):
         self.stop_clocks()
         self._clock_channels[:] = []
         self._used_clock_channel_names.clear()
-        self._unused_clock_channel_names = set(
+        self._unused_clock_channel_names = list(
             LabJackT4.available_output_clock_channels
         )
+        self._start_register_config = {self._clock_on_indicator_channel: 1}
+        self._start_register_frames = None
 
 
 @final
@@ -687,6 +815,7 @@ class LabJackEdgeStreamer:
         internal_clock_sampling_rate_hz: int | float,
         scan_rate_hz: int = 1000,
         filename: str | Path | None = None,
+        scans_per_read: int | None = None,
     ):
         self.handle = handle
         self.channel_names = channel_names.copy()
@@ -694,18 +823,37 @@ class LabJackEdgeStreamer:
         self.channel_names.extend(["CORE_TIMER", "STREAM_DATA_CAPTURE_16"])
 
         self.scan_rate = scan_rate_hz
-        self.scans_per_read = int(scan_rate_hz / 2)
+        # Larger reads amortize the per-eStreamRead Python and allocation
+        # overhead, but edge timestamps are only emitted once per read, so
+        # latency grows by scans_per_read / scan_rate seconds. The default
+        # reads twice a second, with a floor so very low scan rates still
+        # fill a reasonable LJM buffer per call.
+        if scans_per_read is None:
+            scans_per_read = max(int(scan_rate_hz / 2), 100)
+        self.scans_per_read = scans_per_read
         self.internal_clock_sampling_rate_hz = int(internal_clock_sampling_rate_hz)
+        # 1e9 divides evenly by the 40 MHz core timer rate, so tick->ns is
+        # a single exact integer multiply per edge; the divide fallback
+        # only exists for exotic rates
+        if 1_000_000_000 % self.internal_clock_sampling_rate_hz == 0:
+            self._ns_multiplier = 1_000_000_000 // self.internal_clock_sampling_rate_hz
+        else:
+            self._ns_multiplier = None
         self.number_of_detected_edges = 0
 
         if filename is None:
+            # Created on demand rather than at import time
+            os.makedirs(DEFAULT_OUTPUT_DIRECTORY, exist_ok=True)
             timestamp_str = time.strftime("%Y-%m-%d_%H-%M-%S")
             filename = os.path.join(
                 DEFAULT_OUTPUT_DIRECTORY, f"labjack_stream_{timestamp_str}.csv"
             )
 
         self.filename = filename
-        self._file = open(self.filename, "w", newline="")
+        # binary mode with a large buffer: the streaming loop writes
+        # preformatted bytes and relies on block buffering instead of
+        # flushing per read
+        self._file = open(self.filename, "wb", buffering=1 << 20)
 
         # Threading control
         self.streaming_thread: threading.Thread | None = None
@@ -717,6 +865,28 @@ class LabJackEdgeStreamer:
         self._skipped_samples = 0
         self._last_row = np.zeros(shape=(1, self.number_of_sampled_channels + 1))
 
+        # scan buffer reused across reads so each eStreamRead result is
+        # copied out of the LJM list in one C-level assignment instead of
+        # allocating a fresh array per read
+        self._scan_buffer = np.empty(
+            self.scans_per_read * len(self.channel_names), dtype=np.float64
+        )
+
+        # int64 working block (DIO columns + combined timestamp) reused
+        # across reads
+        self._data_buffer = np.empty(
+            (self.scans_per_read, self.number_of_sampled_channels + 1),
+            dtype=np.int64,
+        )
+
+        # formatted CSV bytes not yet handed to the file; flushed in large
+        # blocks to coalesce writes across reads. Serialization runs on a
+        # dedicated writer thread fed through a bounded queue so a slow
+        # flush cannot stall eStreamRead and grow the device backlog.
+        self._pending_csv = bytearray()
+        self._write_queue: queue.Queue[np.ndarray | None] = queue.Queue(maxsize=32)
+        self._writer_thread: threading.Thread | None = None
+
         # CORE_TIMER rollover tracking (UINT32 rollover at 2^32)
         self._timer_rollover_count = 0
         self._timer_offset = np.int64(0)  # Cumulative offset due to rollovers
@@ -726,8 +896,24 @@ class LabJackEdgeStreamer:
         except Exception as e:
             pass
 
-    def __del__(self):
-        self._file.close()
+        # Resolve the scan list and write the stream settings once; both are
+        # multi-ms device round-trips that do not change between streaming
+        # sessions.
+        self._scan_list = ljm.namesToAddresses(
+            len(self.channel_names), self.channel_names
+        )[0]
+        ljm.eWriteNames(
+            self.handle,
+            2,
+            ["STREAM_SETTLING_US", "STREAM_RESOLUTION_INDEX"],
+            [0, 0],
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop_streaming()
 
     def _process_timer_data_with_rollover_detection(
         self, data: np.ndarray
@@ -748,17 +934,26 @@ class LabJackEdgeStreamer:
         # We need to detect rollover BEFORE applying offset, so we compare raw-to-raw
         raw_timer_values = data[:, -1]
 
-        # Prepend the last value from the previous batch to detect rollover at the start
-        extended_timers = np.concatenate(([self._last_row[0, -1]], raw_timer_values))
-
-        # Calculate differences between consecutive elements
-        diffs = np.diff(extended_timers)
-
-        # Detect rollovers (large negative drop)
-        # Threshold: -2^31 (half of UINT32 range)
-        rollover_mask = diffs < -(2**31)
+        # Detect rollovers (large negative drop between consecutive values).
+        # Threshold: -2^31 (half of UINT32 range). Almost every batch has
+        # none, so the check works on shifted views instead of building the
+        # concatenate/diff temporaries of the full column.
+        threshold = np.int64(2**31)
+        rolled_at_start = bool(
+            raw_timer_values[0] < self._last_row[0, -1] - threshold
+        )
+        has_rollover = rolled_at_start or bool(
+            np.any(raw_timer_values[1:] < raw_timer_values[:-1] - threshold)
+        )
 
-        if np.any(rollover_mask):
+        if has_rollover:
+            rollover_mask = np.empty(raw_timer_values.shape[0], dtype=bool)
+            rollover_mask[0] = rolled_at_start
+            np.less(
+                raw_timer_values[1:],
+                raw_timer_values[:-1] - threshold,
+                out=rollover_mask[1:],
+            )
             rollover_count = np.sum(rollover_mask)
             self._timer_rollover_count += rollover_count
 
@@ -788,7 +983,17 @@ class LabJackEdgeStreamer:
         if self.is_streaming():
             logger.info("Streaming already running!")
             return
+        if self._file.closed:
+            # stop_streaming closes the output file; reopening in "wb"
+            # would silently truncate the recorded edges, so a restart
+            # needs a fresh streamer instead
+            raise XClockException(
+                f"Output file {self.filename} is closed; "
+                "create a new LabJackEdgeStreamer to stream again"
+            )
         self.stop_event.clear()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
         self.streaming_thread = threading.Thread(
             target=self._streaming_loop, daemon=True
         )
@@ -802,34 +1007,85 @@ class LabJackEdgeStreamer:
         )
 
     def stop_streaming(self):
-        """Stop background streaming"""
+        """Stop background streaming and close the output file."""
         if self.is_streaming():
             self.stop_event.set()
             self.streaming_thread.join(timeout=2.0)  # type: ignore is_streaming asserts  # pyright: ignore[reportOptionalMemberAccess]
             logger.info("Background streaming stopped")
+        if self._writer_thread is not None:
+            # sentinel makes the writer flush its remaining bytes and exit
+            try:
+                self._write_queue.put(None, timeout=1.0)
+            except queue.Full:
+                # writer died with a full queue; make room for the sentinel
+                # instead of blocking the caller forever
+                while True:
+                    try:
+                        self._write_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._write_queue.put_nowait(None)
+            self._writer_thread.join(timeout=2.0)
+            self._writer_thread = None
+        if not self._file.closed:
+            self._file.close()
 
     def is_streaming(self) -> bool:
         """Check if streaming is active"""
         return self.streaming_thread is not None and self.streaming_thread.is_alive()
 
+    def _writer_loop(self):
+        """Format queued edge batches and write them to the CSV file.
+
+        A failed write (disk full, closed file) must not kill the thread:
+        the bounded queue would fill and wedge the streaming loop. Instead
+        the loop keeps draining and drops batches after the first failure.
+        """
+        failed = False
+        while True:
+            edge_timestamps = self._write_queue.get()
+            if edge_timestamps is None:
+                break
+            if failed:
+                continue
+            try:
+                # hand-formatted bytes are much faster than np.savetxt,
+                # which formats and writes row by row
+                row_format = ",".join(["%d"] * edge_timestamps.shape[1]) + "\n"
+                self._pending_csv += (
+                    (row_format * edge_timestamps.shape[0])
+                    % tuple(edge_timestamps.ravel())
+                ).encode()
+                if len(self._pending_csv) > 1 << 20:
+                    self._file.write(self._pending_csv)
+                    self._pending_csv.clear()
+            except Exception:
+                logger.exception(
+                    "Writing edge timestamps to %s failed; "
+                    "dropping further batches",
+                    self.filename,
+                )
+                failed = True
+                self._pending_csv.clear()
+        if self._pending_csv:
+            try:
+                self._file.write(self._pending_csv)
+            except Exception:
+                logger.exception(
+                    "Flushing remaining edge timestamps to %s failed",
+                    self.filename,
+                )
+            self._pending_csv.clear()
+
     def _streaming_loop(self):
         """Main streaming loop running in background thread"""
         try:
-            # Setup streaming
-            aScanList = ljm.namesToAddresses(
-                len(self.channel_names), self.channel_names
-            )[0]
-
-            aNames = ["STREAM_SETTLING_US", "STREAM_RESOLUTION_INDEX"]
-            aValues = [0, 0]
-            ljm.eWriteNames(self.handle, len(aNames), aNames, aValues)
-
             actual_scan_rate = ljm.eStreamStart(
                 handle=self.handle,
                 scansPerRead=self.scans_per_read,
                 scanRate=self.scan_rate,
-                aScanList=aScanList,
-                numAddresses=len(aScanList),
+                aScanList=self._scan_list,
+                numAddresses=len(self._scan_list),
             )
 
             if self.scan_rate != actual_scan_rate:
@@ -849,25 +1105,48 @@ class LabJackEdgeStreamer:
                 self.ready_event.set()
 
                 logger.debug(
-                    f"Read {len(aData)} data points from stream backlog={deviceScanBacklog}/{ljmScanBacklog} (device/host)"
+                    "Read %d data points from stream backlog=%s/%s (device/host)",
+                    len(aData),
+                    deviceScanBacklog,
+                    ljmScanBacklog,
                 )
 
-                curSkip: int = aData.count(SKIP_VALUE)
+                scan_buffer = self._scan_buffer[: len(aData)]
+                scan_buffer[:] = aData
+
+                curSkip = int(np.count_nonzero(scan_buffer == SKIP_VALUE))
                 if curSkip > 0:
-                    logger.warning(f"Skipped {curSkip} samples in this read")
+                    logger.warning("Skipped %d samples in this read", curSkip)
                 self._skipped_samples += curSkip
 
-                data = np.array(aData, dtype=np.int64).reshape((-1, len(aScanList)))
-
-                # Combine 2 x 16 bit timer columns
-                data[:, -2] += data[:, -1] << 16
-                data = data[:, :-1]  # Drop last column
+                scans = scan_buffer.reshape((-1, len(self._scan_list)))
+
+                # Assemble the int64 working block in one pass: DIO columns
+                # plus the combined 2 x 16 bit timer column. This avoids an
+                # int64 copy of the full raw buffer followed by a second
+                # pass for the shift-add and a non-contiguous trailing view.
+                data = self._data_buffer[: scans.shape[0], :]
+                data[:, :-1] = scans[:, : self.number_of_sampled_channels]
+                timestamps = data[:, -1]
+                timestamps[:] = scans[:, -1]  # STREAM_DATA_CAPTURE_16, upper word
+                timestamps <<= 16
+                # CORE_TIMER, lower word; unsafe cast adds the float column
+                # in place without materializing an int64 temporary
+                np.add(timestamps, scans[:, -2], out=timestamps, casting="unsafe")
 
                 # Process timer data with rollover detection
                 data = self._process_timer_data_with_rollover_detection(data)
 
                 # data[:, -1] -= self._start_streaming_timestamp
 
+                # Fast path: no DIO level changed anywhere in this read
+                # (common for slow clocks at high scan rates), so skip edge
+                # detection and output formatting entirely.
+                if not np.any(data[:, :-1] != self._last_row[0, :-1]):
+                    self._last_row = data[-1:, :].copy()
+                    self._last_row[0, -1] -= self._timer_offset
+                    continue
+
                 edge_timestamps = detect_edges_along_columns(
                     data,
                     number_of_data_columns=self.number_of_sampled_channels,
@@ -876,40 +1155,50 @@ class LabJackEdgeStreamer:
 
                 self.number_of_detected_edges += edge_timestamps.shape[0]
 
-                # convert timestamps to nanoseconds
-                edge_timestamps[:, 0] = edge_timestamps[:, 0] / (
-                    self.internal_clock_sampling_rate_hz / 1e9
-                )
+                # convert timestamps to nanoseconds using pure integer math
+                # to avoid a float64 round-trip and precision loss near 2^53
+                if self._ns_multiplier is not None:
+                    edge_timestamps[:, 0] *= self._ns_multiplier
+                else:
+                    edge_timestamps[:, 0] *= 1_000_000_000
+                    edge_timestamps[:, 0] //= self.internal_clock_sampling_rate_hz
 
                 # Update last row for next iteration but keep 2d shape
                 # Store RAW timer value (before offset) for rollover detection
                 # We need to subtract the current offset to get back to raw value
-                self._last_row = data[[-1], :].copy()
+                self._last_row = data[-1:, :].copy()
                 self._last_row[0, -1] -= self._timer_offset
 
-                # add host timestamp as last column to data before writing to disk
-                edge_timestamps = np.hstack(
-                    (
-                        edge_timestamps,
-                        np.full(
-                            (edge_timestamps.shape[0], 1),
-                            current_host_timestamp,
-                            dtype=np.int64,
-                        ),
-                    )
+                # add host timestamp as last column before writing to disk.
+                # One empty allocation plus two assignments instead of the
+                # hstack path, which also materialized a full-size column
+                # array first. The batch cannot live in a reused buffer
+                # because the writer thread consumes it asynchronously.
+                output_rows = np.empty(
+                    (edge_timestamps.shape[0], edge_timestamps.shape[1] + 1),
+                    dtype=np.int64,
                 )
-
-                if self._file:
-                    np.savetxt(
-                        self._file,
-                        edge_timestamps,
-                        delimiter=",",
-                        fmt="%d",
-                    )
+                output_rows[:, :-1] = edge_timestamps
+                output_rows[:, -1] = current_host_timestamp
+                edge_timestamps = output_rows
+
+                if edge_timestamps.size > 0:
+                    # blocks only if the writer is more than 32 batches
+                    # behind, which back-pressures acquisition instead of
+                    # growing memory without bound; the timeout keeps a
+                    # dead writer from wedging this loop (and stop_event)
+                    try:
+                        self._write_queue.put(edge_timestamps, timeout=1.0)
+                    except queue.Full:
+                        logger.error(
+                            "CSV writer not keeping up; dropping %d edges",
+                            edge_timestamps.shape[0],
+                        )
         except Exception as e:
             logger.error(f"Streaming setup error: {e}")
         finally:
-            # Clean up
+            # Clean up; remaining CSV bytes are flushed by the writer
+            # thread when stop_streaming hands it the sentinel
             try:
                 ljm.eStreamStop(self.handle)
             except:
@@ -952,7 +1241,7 @@ if __name__ == "__main__":
             f"Waiting for input trigger on channel {input_trigger_channel} for {timeout} s"
         )
         if t4.wait_for_trigger_edge(input_trigger_channel, timeout_s=timeout):
-            logger.debug(f"Detected input trigger on channel {input_trigger_channel}")
+            logger.debug("Detected input trigger on channel %s", input_trigger_channel)
             t4.start_clocks()
 
         else:
@@ -24,39 +24,30 @@ def detect_edges_along_columns(
     if prepend is not None:
         data = np.concatenate((prepend, data), axis=0)
 
-    transitions = np.diff(data, axis=0)
+    # Only diff the data columns; diffing the (typically int64) timestamp
+    # column as well would double the memory traffic of this pass.
+    transitions = np.diff(data[:, :number_of_data_columns], axis=0)
 
-    number_of_transitions = sum(
-        (transitions[:, :number_of_data_columns] != 0).flatten()
-    )
+    # Single pass over the flattened transitions matrix. flatnonzero yields
+    # row-major indices, i.e. already ordered by timestamp, so no final sort
+    # is needed.
+    nonzero_indices = np.flatnonzero(transitions)
+    row_indices, column_indices = np.divmod(nonzero_indices, number_of_data_columns)
+
+    signs = transitions[row_indices, column_indices]
 
     # timestamp x channel/column number
-    edge_timestamps = np.zeros(shape=(number_of_transitions, 2), dtype=np.int64)
-
-    current_row_index = 0
-    for channel_index in range(number_of_data_columns):
-        rising_indices = np.where(transitions[:, channel_index] == 1)[0]
-        edge_timestamps[
-            current_row_index : current_row_index + rising_indices.size, 0
-        ] = data[rising_indices + 1, -1]
-        edge_timestamps[
-            current_row_index : current_row_index + rising_indices.size, 1
-        ] = channel_index + 1
-        current_row_index += rising_indices.size
-
-        falling_indices = np.where(transitions[:, channel_index] == -1)[0]
-        edge_timestamps[
-            current_row_index : current_row_index + falling_indices.size, 0
-        ] = data[falling_indices + 1, -1]
-        edge_timestamps[
-            current_row_index : current_row_index + falling_indices.size, 1
-        ] = -(channel_index + 1)
-        current_row_index += falling_indices.size
-        logger.debug(
-            f"Detected {rising_indices.size} rising edges on channel {channel_index}"
+    edge_timestamps = np.column_stack(
+        (
+            data[row_indices + 1, -1],
+            np.where(signs > 0, column_indices + 1, -(column_indices + 1)),
         )
+    ).astype(np.int64, copy=False)
 
-    # sort by timestamp (TODO: Is this in-place?)
-    edge_timestamps = edge_timestamps[edge_timestamps[:, 0].argsort(), :]
+    logger.debug(
+        "Detected %d edges on %d channels",
+        edge_timestamps.shape[0],
+        number_of_data_columns,
+    )
 
     return edge_timestamps
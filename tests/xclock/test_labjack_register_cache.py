@@ -0,0 +1,94 @@
+"""
+Test the register write cache in LabJackT4 with mocked hardware.
+
+The cache elides config frames whose value the device is already known to
+hold, so these tests assert that a reconfiguration with identical
+parameters skips the cached frames while still writing the frames the
+device changes on its own (disable/LOW/enable), and that changed
+parameters are written again.
+"""
+
+from unittest.mock import patch
+
+from xclock.devices.labjack_devices import LabJackT4
+
+
+def _written_names(mock_ljm) -> list[str]:
+    """Flatten the register names of all eWriteNames calls on the mock."""
+    names: list[str] = []
+    for call in mock_ljm.eWriteNames.call_args_list:
+        frame_names = call.kwargs.get(
+            "aNames", call.args[2] if len(call.args) > 2 else []
+        )
+        names.extend(frame_names)
+    return names
+
+
+def _open_mock_t4(mock_ljm) -> LabJackT4:
+    mock_ljm.constants.dtT4 = 4
+    mock_ljm.constants.ctUSB = 1
+    mock_ljm.openS.return_value = 1
+    mock_ljm.getHandleInfo.return_value = (4, 1, 440000000, 0, 0, 0)
+    return LabJackT4()
+
+
+def test_identical_reconfiguration_skips_cached_frames():
+    with (
+        patch("xclock.devices.labjack_devices.ljm") as mock_ljm,
+        patch("xclock.devices.labjack_devices.LJM_AVAILABLE", True),
+    ):
+        t4 = _open_mock_t4(mock_ljm)
+
+        mock_ljm.eWriteNames.reset_mock()
+        t4.add_clock_channel(clock_tick_rate_hz=1000, channel_name="DIO6")
+        first_names = _written_names(mock_ljm)
+
+        # the first configuration writes all clock and EF config frames
+        assert "DIO_EF_CLOCK1_DIVISOR" in first_names
+        assert "DIO_EF_CLOCK1_ROLL_VALUE" in first_names
+        assert "DIO6_EF_INDEX" in first_names
+        assert "DIO6_EF_CONFIG_A" in first_names
+
+        t4.clear_clocks()
+        mock_ljm.eWriteNames.reset_mock()
+        t4.add_clock_channel(clock_tick_rate_hz=1000, channel_name="DIO6")
+        second_names = _written_names(mock_ljm)
+
+        # identical parameters: all config frames are served from the cache
+        assert "DIO_EF_CLOCK1_DIVISOR" not in second_names
+        assert "DIO_EF_CLOCK1_ROLL_VALUE" not in second_names
+        assert "DIO6_EF_INDEX" not in second_names
+        assert "DIO6_EF_CONFIG_A" not in second_names
+
+        # but the frames the device changes on its own still go out:
+        # clock disable, EF disable and the channel set LOW
+        assert "DIO_EF_CLOCK1_ENABLE" in second_names
+        assert "DIO6_EF_ENABLE" in second_names
+        assert "DIO6" in second_names
+
+        t4.close()
+
+
+def test_changed_parameters_are_written():
+    with (
+        patch("xclock.devices.labjack_devices.ljm") as mock_ljm,
+        patch("xclock.devices.labjack_devices.LJM_AVAILABLE", True),
+    ):
+        t4 = _open_mock_t4(mock_ljm)
+
+        t4.add_clock_channel(clock_tick_rate_hz=1000, channel_name="DIO6")
+        t4.clear_clocks()
+
+        mock_ljm.eWriteNames.reset_mock()
+        t4.add_clock_channel(clock_tick_rate_hz=2000, channel_name="DIO6")
+        names = _written_names(mock_ljm)
+
+        # the new rate changes roll value and duty cycle, so those frames
+        # are written; the divisor and feature index are unchanged and stay
+        # cached
+        assert "DIO_EF_CLOCK1_ROLL_VALUE" in names
+        assert "DIO6_EF_CONFIG_A" in names
+        assert "DIO_EF_CLOCK1_DIVISOR" not in names
+        assert "DIO6_EF_INDEX" not in names
+
+        t4.close()